@@ -2,12 +2,54 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, Collection, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 from tailorcv.llm.selection_schema import LlmSelectionPlan
 from tailorcv.schema.profile_schema import Profile
 
 
+@dataclass(frozen=True)
+class _EntrySpec:
+    """
+    Field layout for mapping one profile entry type to a RenderCV entry.
+
+    Profile attribute names match the RenderCV keys, so each name doubles as the
+    source attribute and target key.
+
+    :param required: Fields always copied.
+    :type required: tuple[str, ...]
+    :param optional: Scalar fields copied only when not None.
+    :type optional: tuple[str, ...]
+    """
+
+    required: Tuple[str, ...]
+    optional: Tuple[str, ...]
+
+
+_EXPERIENCE_SPEC = _EntrySpec(
+    required=("company", "position"),
+    optional=("location", "date", "start_date", "end_date", "summary"),
+)
+_EDUCATION_SPEC = _EntrySpec(
+    required=("institution", "area"),
+    optional=("degree", "location", "date", "start_date", "end_date", "summary"),
+)
+_PROJECT_SPEC = _EntrySpec(
+    required=("name",),
+    optional=("summary", "location", "date", "start_date", "end_date"),
+)
+
+# Optional header fields; profile.meta attribute names match the RenderCV keys.
+_HEADER_OPTIONAL = ("headline", "location", "email", "phone", "website")
+
+_get_id = attrgetter("id")
+
+# Selections at or below this size are matched with a list scan instead of a set.
+_MAX_LINEAR_SCAN_LABELS = 4
+
+
 def build_cv_dict(profile: Profile, plan: LlmSelectionPlan) -> Dict[str, Any]:
     """
     Build a RenderCV-ready cv dictionary from a profile and selection plan.
@@ -26,27 +68,31 @@ def build_cv_dict(profile: Profile, plan: LlmSelectionPlan) -> Dict[str, Any]:
 
     _apply_header(cv, profile)
 
+    mapped_sections: Dict[str, List[Dict[str, Any]]] = {
+        "Experience": _map_entries(
+            profile.experience, frozenset(plan.selected_experience_ids), plan, _EXPERIENCE_SPEC
+        ),
+        "Projects": _map_entries(
+            profile.projects, frozenset(plan.selected_project_ids), plan, _PROJECT_SPEC
+        ),
+        "Education": _map_entries(
+            profile.education, frozenset(plan.selected_education_ids), plan, _EDUCATION_SPEC
+        ),
+        "Skills": _map_skills(profile, plan.selected_skill_labels),
+    }
+
+    # Emit preferred titles first, then the rest in default order, skipping empties.
     sections: Dict[str, List[Dict[str, Any]]] = {}
+    for title in plan.section_order:
+        entries = mapped_sections.get(title)
+        if entries:
+            sections[title] = entries
+    for title, entries in mapped_sections.items():
+        if entries and title not in sections:
+            sections[title] = entries
 
-    experience_entries = _map_experience(profile, plan)
-    if experience_entries:
-        sections["Experience"] = experience_entries
-
-    project_entries = _map_projects(profile, plan)
-    if project_entries:
-        sections["Projects"] = project_entries
-
-    education_entries = _map_education(profile, plan)
-    if education_entries:
-        sections["Education"] = education_entries
-
-    skill_entries = _map_skills(profile, plan)
-    if skill_entries:
-        sections["Skills"] = skill_entries
-
-    ordered_sections = _order_sections(sections, plan.section_order)
-    if ordered_sections:
-        cv["sections"] = ordered_sections
+    if sections:
+        cv["sections"] = sections
 
     return {"cv": cv}
 
@@ -64,11 +110,10 @@ def _apply_header(cv: Dict[str, Any], profile: Profile) -> None:
     """
     meta = profile.meta
     cv["name"] = meta.name
-    _set_if_present(cv, "headline", meta.headline)
-    _set_if_present(cv, "location", meta.location)
-    _set_if_present(cv, "email", meta.email)
-    _set_if_present(cv, "phone", meta.phone)
-    _set_if_present(cv, "website", meta.website)
+    for name in _HEADER_OPTIONAL:
+        value = getattr(meta, name)
+        if value is not None:
+            cv[name] = value
 
     if meta.socials:
         cv["social_networks"] = [
@@ -76,141 +121,96 @@ def _apply_header(cv: Dict[str, Any], profile: Profile) -> None:
         ]
 
 
-def _map_experience(profile: Profile, plan: LlmSelectionPlan) -> List[Dict[str, Any]]:
+def _map_entries(
+    items: Iterable[Any],
+    selected_ids: FrozenSet[str],
+    plan: LlmSelectionPlan,
+    spec: _EntrySpec,
+) -> List[Dict[str, Any]]:
     """
-    Map experience entries to RenderCV ExperienceEntry dictionaries.
+    Map experience, education, or project entries to RenderCV entry dictionaries.
 
-    :param profile: Parsed profile input.
-    :type profile: tailorcv.schema.profile_schema.Profile
+    :param items: Profile entries with ``id`` and ``highlights`` attributes.
+    :type items: collections.abc.Iterable[typing.Any]
+    :param selected_ids: Selected entry IDs (empty means all entries).
+    :type selected_ids: frozenset[str]
     :param plan: LLM selection plan.
     :type plan: tailorcv.llm.selection_schema.LlmSelectionPlan
-    :return: Experience entry dictionaries.
+    :param spec: Field layout for this entry type.
+    :type spec: _EntrySpec
+    :return: Entry dictionaries.
     :rtype: list[dict[str, typing.Any]]
     """
-    entries = _select_items(profile.experience, plan.selected_experience_ids)
-    mapped: List[Dict[str, Any]] = []
-    for exp in entries:
-        item: Dict[str, Any] = {
-            "company": exp.company,
-            "position": exp.position,
-        }
-        _set_if_present(item, "location", exp.location)
-        _set_if_present(item, "date", exp.date)
-        _set_if_present(item, "start_date", exp.start_date)
-        _set_if_present(item, "end_date", exp.end_date)
-        _set_if_present(item, "summary", exp.summary)
-
-        highlights = _resolve_highlights(exp.id, exp.highlights, plan)
-        if highlights:
-            item["highlights"] = highlights
-
-        mapped.append(item)
-    return mapped
-
-
-def _map_education(profile: Profile, plan: LlmSelectionPlan) -> List[Dict[str, Any]]:
-    """
-    Map education entries to RenderCV EducationEntry dictionaries.
+    return [_build_entry_item(entry, plan, spec) for entry in _select_items(items, selected_ids)]
 
-    :param profile: Parsed profile input.
-    :type profile: tailorcv.schema.profile_schema.Profile
-    :param plan: LLM selection plan.
-    :type plan: tailorcv.llm.selection_schema.LlmSelectionPlan
-    :return: Education entry dictionaries.
-    :rtype: list[dict[str, typing.Any]]
-    """
-    entries = _select_items(profile.education, plan.selected_education_ids)
-    mapped: List[Dict[str, Any]] = []
-    for edu in entries:
-        item: Dict[str, Any] = {
-            "institution": edu.institution,
-            "area": edu.area,
-        }
-        _set_if_present(item, "degree", edu.degree)
-        _set_if_present(item, "location", edu.location)
-        _set_if_present(item, "date", edu.date)
-        _set_if_present(item, "start_date", edu.start_date)
-        _set_if_present(item, "end_date", edu.end_date)
-        _set_if_present(item, "summary", edu.summary)
-
-        highlights = _resolve_highlights(edu.id, edu.highlights, plan)
-        if highlights:
-            item["highlights"] = highlights
-
-        mapped.append(item)
-    return mapped
-
-
-def _map_projects(profile: Profile, plan: LlmSelectionPlan) -> List[Dict[str, Any]]:
+
+def _build_entry_item(entry: Any, plan: LlmSelectionPlan, spec: _EntrySpec) -> Dict[str, Any]:
     """
-    Map project entries to RenderCV NormalEntry dictionaries.
+    Build a RenderCV entry dictionary for a single profile entry.
 
-    :param profile: Parsed profile input.
-    :type profile: tailorcv.schema.profile_schema.Profile
+    :param entry: Profile entry with ``id`` and ``highlights`` attributes.
+    :type entry: typing.Any
     :param plan: LLM selection plan.
     :type plan: tailorcv.llm.selection_schema.LlmSelectionPlan
-    :return: Project entry dictionaries.
-    :rtype: list[dict[str, typing.Any]]
+    :param spec: Field layout for this entry type.
+    :type spec: _EntrySpec
+    :return: Entry dictionary.
+    :rtype: dict[str, typing.Any]
     """
-    entries = _select_items(profile.projects, plan.selected_project_ids)
-    mapped: List[Dict[str, Any]] = []
-    for proj in entries:
-        item: Dict[str, Any] = {
-            "name": proj.name,
-        }
-        _set_if_present(item, "summary", proj.summary)
-        _set_if_present(item, "location", proj.location)
-        _set_if_present(item, "date", proj.date)
-        _set_if_present(item, "start_date", proj.start_date)
-        _set_if_present(item, "end_date", proj.end_date)
-
-        highlights = _resolve_highlights(proj.id, proj.highlights, plan)
-        if highlights:
-            item["highlights"] = highlights
-
-        mapped.append(item)
-    return mapped
-
-
-def _map_skills(profile: Profile, plan: LlmSelectionPlan) -> List[Dict[str, Any]]:
+    item: Dict[str, Any] = {name: getattr(entry, name) for name in spec.required}
+    for name in spec.optional:
+        value = getattr(entry, name)
+        if value is not None:
+            item[name] = value
+
+    highlights = _resolve_highlights(entry.id, entry.highlights, plan)
+    if highlights:
+        item["highlights"] = highlights
+    return item
+
+
+def _map_skills(profile: Profile, selected_labels: List[str]) -> List[Dict[str, Any]]:
     """
     Map skill entries to RenderCV OneLineEntry dictionaries.
 
     :param profile: Parsed profile input.
     :type profile: tailorcv.schema.profile_schema.Profile
-    :param plan: LLM selection plan.
-    :type plan: tailorcv.llm.selection_schema.LlmSelectionPlan
+    :param selected_labels: Selected skill labels (empty means all skills).
+    :type selected_labels: list[str]
     :return: Skill entry dictionaries.
     :rtype: list[dict[str, typing.Any]]
     """
-    selected_labels = set(plan.selected_skill_labels)
-    if selected_labels:
-        entries = [s for s in profile.skills if s.label in selected_labels]
+    if not selected_labels:
+        entries = profile.skills
     else:
-        entries = list(profile.skills)
+        # A short list scan beats building a set for a handful of labels.
+        if len(selected_labels) > _MAX_LINEAR_SCAN_LABELS:
+            labels: Collection[str] = frozenset(selected_labels)
+        else:
+            labels = selected_labels
+        entries = [s for s in profile.skills if s.label in labels]
 
-    mapped: List[Dict[str, Any]] = []
-    for skill in entries:
-        mapped.append({"label": skill.label, "details": skill.details})
-    return mapped
+    return [{"label": skill.label, "details": skill.details} for skill in entries]
 
 
-def _select_items(items: Iterable[Any], selected_ids: List[str]) -> List[Any]:
+def _select_items(items: Iterable[Any], selected_ids: FrozenSet[str]) -> List[Any]:
     """
     Select items by ID or return all items when selection is empty.
 
+    When the selection is empty and ``items`` is already a list, it is returned
+    as-is; callers must treat the result as read-only.
+
     :param items: Iterable of items with an ``id`` attribute.
     :type items: collections.abc.Iterable[typing.Any]
     :param selected_ids: IDs to include.
-    :type selected_ids: list[str]
+    :type selected_ids: frozenset[str]
     :return: Selected items.
     :rtype: list[typing.Any]
     """
     if not selected_ids:
-        return list(items)
+        return items if isinstance(items, list) else list(items)
 
-    selected = set(selected_ids)
-    return [item for item in items if item.id in selected]
+    return [item for item in items if _get_id(item) in selected_ids]
 
 
 def _resolve_highlights(
@@ -221,6 +221,10 @@ def _resolve_highlights(
     """
     Resolve highlights using LLM overrides when provided.
 
+    Always returns a new list so output entries never share list objects; an
+    override keyed by an ID used in two sections would otherwise be written as a
+    YAML anchor/alias pair.
+
     :param entry_id: Entry identifier used for overrides.
     :type entry_id: str | None
     :param highlights: Original highlights from the profile.
@@ -230,56 +234,8 @@ def _resolve_highlights(
     :return: Highlights to include.
     :rtype: list[str]
     """
-    if entry_id and entry_id in plan.bullet_overrides:
-        return list(plan.bullet_overrides[entry_id])
+    if entry_id and plan.bullet_overrides:
+        override = plan.bullet_overrides.get(entry_id)
+        if override is not None:
+            return list(override)
     return list(highlights)
-
-
-def _order_sections(
-    sections: Dict[str, List[Dict[str, Any]]],
-    preferred_order: List[str],
-) -> Dict[str, List[Dict[str, Any]]]:
-    """
-    Order sections based on preferred order and remaining defaults.
-
-    :param sections: Section mapping to order.
-    :type sections: dict[str, list[dict[str, typing.Any]]]
-    :param preferred_order: Preferred section order from the LLM.
-    :type preferred_order: list[str]
-    :return: Ordered sections mapping.
-    :rtype: dict[str, list[dict[str, typing.Any]]]
-    """
-    if not preferred_order:
-        return sections
-
-    ordered: Dict[str, List[Dict[str, Any]]] = {}
-    remaining = {k: v for k, v in sections.items()}
-
-    for title in preferred_order:
-        if title in remaining:
-            ordered[title] = remaining.pop(title)
-
-    for title, entries in remaining.items():
-        ordered[title] = entries
-
-    return ordered
-
-
-def _set_if_present(target: Dict[str, Any], key: str, value: Any) -> None:
-    """
-    Set a key only if the value is not None or empty.
-
-    :param target: Dictionary to mutate.
-    :type target: dict[str, typing.Any]
-    :param key: Key name to set.
-    :type key: str
-    :param value: Value to set.
-    :type value: typing.Any
-    :return: None.
-    :rtype: None
-    """
-    if value is None:
-        return
-    if isinstance(value, list) and not value:
-        return
-    target[key] = value
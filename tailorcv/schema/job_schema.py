@@ -1,6 +1,6 @@
 """Schema representing a job description input."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Job(BaseModel):
@@ -8,6 +8,8 @@ class Job(BaseModel):
     Representation of a job posting.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     raw_text: str
     cleaned_text: str
     keywords: list[str]
@@ -1 +1,72 @@
-"""Model definitions used by profile and RenderCV schemas."""
+"""Profile entry models used by profile and RenderCV schemas."""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class BaseItem(BaseModel):
+    """Common fields for profile entries that support tags."""
+
+    model_config = ConfigDict(frozen=True)
+
+    id: Optional[str] = None
+    tags: List[str] = Field(default_factory=list)
+
+
+class Education(BaseModel):
+    """Education entry with optional dates and highlights."""
+
+    model_config = ConfigDict(frozen=True)
+
+    id: Optional[str] = None
+    institution: str
+    area: str
+    degree: Optional[str] = None
+    location: Optional[str] = None
+    date: Optional[str] = None
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    summary: Optional[str] = None
+    highlights: List[str] = Field(default_factory=list)
+    tags: List[str] = Field(default_factory=list)
+
+
+class Experience(BaseModel):
+    """Experience entry with optional dates and highlights."""
+
+    model_config = ConfigDict(frozen=True)
+
+    id: Optional[str] = None
+    company: str
+    position: str
+    location: Optional[str] = None
+    date: Optional[str] = None
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    summary: Optional[str] = None
+    highlights: List[str] = Field(default_factory=list)
+    tags: List[str] = Field(default_factory=list)
+
+
+class Project(BaseModel):
+    """Project entry with optional dates and highlights."""
+
+    model_config = ConfigDict(frozen=True)
+
+    id: Optional[str] = None
+    name: str
+    summary: Optional[str] = None
+    location: Optional[str] = None
+    date: Optional[str] = None
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    highlights: List[str] = Field(default_factory=list)
+    tags: List[str] = Field(default_factory=list)
+
+
+class SkillEntry(BaseModel):
+    """Labeled skill list entry."""
+
+    label: str
+    details: str
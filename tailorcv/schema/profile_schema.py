@@ -4,10 +4,7 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
-from .models.education import Education
-from .models.experience import Experience
-from .models.project import Project
-from .models.skillentry import SkillEntry
+from .models import Education, Experience, Project, SkillEntry
 
 
 class Social(BaseModel):
@@ -3,9 +3,12 @@ from __future__ import annotations
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from tailorcv.loaders.job_loader import load_job
 from tailorcv.loaders.profile_loader import ProfileLoadError, load_profile
+from tailorcv.schema.models import Education, Experience, Project, SkillEntry
+from tailorcv.schema.profile_schema import Meta, Profile, Social
 
 
 def test_load_profile_valid(profile_valid_path: Path) -> None:
@@ -13,6 +16,26 @@ def test_load_profile_valid(profile_valid_path: Path) -> None:
     assert profile.meta.name == "Test User"
 
 
+def test_load_profile_list_fields_default_to_empty(profile_valid_path: Path) -> None:
+    profile = load_profile(profile_valid_path)
+    education = profile.education[0]
+    assert education.highlights == []
+    assert education.tags == []
+    assert profile.meta.socials == []
+
+
+def test_load_profile_entries_are_frozen(profile_valid_path: Path) -> None:
+    profile = load_profile(profile_valid_path)
+    with pytest.raises(ValidationError):
+        profile.experience[0].company = "Other Co"
+
+
+def test_profile_models_build_validators_at_import() -> None:
+    # Guards against enabling defer_build, which would move validator builds into loading.
+    for model in (Profile, Meta, Social, Education, Experience, Project, SkillEntry):
+        assert model.__pydantic_complete__
+
+
 def test_load_profile_invalid(profile_invalid_path: Path) -> None:
     with pytest.raises(ProfileLoadError) as exc:
         load_profile(profile_invalid_path)
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import io
 from pathlib import Path
 
+import ruamel.yaml
+
+from tailorcv.assemblers.rendercv_document import assemble_rendercv_document
 from tailorcv.llm.selection_schema import load_selection_plan
 from tailorcv.loaders.profile_loader import load_profile
 from tailorcv.mappers.rendercv_mapper import build_cv_dict
+from tailorcv.schema.profile_schema import Social
 
 
 def test_build_cv_dict_structure(
@@ -41,3 +46,84 @@ def test_build_cv_dict_uses_bullet_overrides(
 
     exp_entry = cv_doc["cv"]["sections"]["Experience"][0]
     assert exp_entry["highlights"] == ["Rewritten bullet from override."]
+
+
+def test_build_cv_dict_applies_section_order(
+    profile_valid_path: Path,
+    selection_valid_path: Path,
+) -> None:
+    profile = load_profile(profile_valid_path)
+    plan = load_selection_plan(selection_valid_path).model_copy(
+        update={"section_order": ["Skills", "Education"]}
+    )
+    cv_doc = build_cv_dict(profile, plan)
+
+    sections = cv_doc["cv"]["sections"]
+    assert list(sections.keys()) == ["Skills", "Education", "Experience", "Projects"]
+
+
+def test_build_cv_dict_header_omits_missing_fields(
+    profile_valid_path: Path,
+    selection_valid_path: Path,
+) -> None:
+    profile = load_profile(profile_valid_path)
+    plan = load_selection_plan(selection_valid_path)
+    cv = build_cv_dict(profile, plan)["cv"]
+
+    assert cv["name"] == "Test User"
+    assert cv["headline"] == "Backend Engineer"
+    assert "phone" not in cv
+    assert "website" not in cv
+    assert "social_networks" not in cv
+
+
+def test_build_cv_dict_skill_filter_matches_for_any_selection_size(
+    profile_valid_path: Path,
+    selection_valid_path: Path,
+) -> None:
+    profile = load_profile(profile_valid_path)
+    plan = load_selection_plan(selection_valid_path)
+    many_labels = ["Languages", "Missing A", "Missing B", "Missing C", "Missing D"]
+    large_plan = plan.model_copy(update={"selected_skill_labels": many_labels})
+
+    small_skills = build_cv_dict(profile, plan)["cv"]["sections"]["Skills"]
+    large_skills = build_cv_dict(profile, large_plan)["cv"]["sections"]["Skills"]
+    assert small_skills == large_skills
+    assert [s["label"] for s in small_skills] == ["Languages"]
+
+
+def test_build_cv_dict_maps_social_networks(
+    profile_valid_path: Path,
+    selection_valid_path: Path,
+) -> None:
+    profile = load_profile(profile_valid_path)
+    socials = [Social(network="GitHub", username="testuser")]
+    meta = profile.meta.model_copy(update={"socials": socials})
+    profile = profile.model_copy(update={"meta": meta})
+    plan = load_selection_plan(selection_valid_path)
+    cv = build_cv_dict(profile, plan)["cv"]
+
+    assert cv["social_networks"] == [{"network": "GitHub", "username": "testuser"}]
+
+
+def test_build_cv_dict_does_not_alias_shared_override_lists(
+    profile_valid_path: Path,
+    selection_overrides_path: Path,
+) -> None:
+    profile = load_profile(profile_valid_path)
+    project = profile.projects[0].model_copy(update={"id": "exp_1"})
+    profile = profile.model_copy(update={"projects": [project]})
+    plan = load_selection_plan(selection_overrides_path).model_copy(
+        update={"selected_project_ids": ["exp_1"]}
+    )
+    cv_doc = build_cv_dict(profile, plan)
+
+    sections = cv_doc["cv"]["sections"]
+    exp_highlights = sections["Experience"][0]["highlights"]
+    proj_highlights = sections["Projects"][0]["highlights"]
+    assert exp_highlights == proj_highlights
+    assert exp_highlights is not proj_highlights
+
+    out = io.StringIO()
+    ruamel.yaml.YAML().dump(assemble_rendercv_document(cv_doc), out)
+    assert "&id" not in out.getvalue()